@@ -17,15 +17,23 @@ from . import furniture_switch_module
 # Collect all classes to register
 classes = (
     # Room classes
+    spawn_room_module.MIORoomOpening,
     spawn_room_module.MIORoomProperties,
     spawn_room_module.MIO_OT_spawn_room,
     spawn_room_module.MIO_OT_scale_room,
     spawn_room_module.MIO_OT_update_room_colors,
     spawn_room_module.MIO_OT_reset_room,
+    spawn_room_module.MIO_OT_add_opening,
+    spawn_room_module.MIO_OT_remove_opening,
+    spawn_room_module.MIO_UL_room_openings,
     spawn_room_module.MIO_PT_room_spawner,
 
     # Furniture classes
+    furniture_switch_module.MIOFurnitureResult,
     furniture_switch_module.MIOFurnitureProperties,
+    furniture_switch_module.MIO_UL_furniture_results,
+    furniture_switch_module.MIO_OT_refresh_furniture_index,
+    furniture_switch_module.MIO_OT_furniture_page,
     furniture_switch_module.MIO_OT_switch_furniture,
     furniture_switch_module.MIO_PT_furniture_switcher,
 )
@@ -39,8 +47,13 @@ def register():
     bpy.types.Scene.mio_room_props = bpy.props.PointerProperty(type=spawn_room_module.MIORoomProperties)
     bpy.types.Scene.mio_furniture_props = bpy.props.PointerProperty(type=furniture_switch_module.MIOFurnitureProperties)
 
+    # Fill the furniture list on startup and whenever a file is opened
+    furniture_switch_module.register_handlers()
+
 
 def unregister():
+    furniture_switch_module.unregister_handlers()
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
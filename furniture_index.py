@@ -0,0 +1,173 @@
+"""
+furniture_index.py
+
+- In-memory index of every .blend model found under the asset tree
+- Room types and categories are discovered from folders (see furniture_loader)
+- Optional per-model metadata is read from a sidecar "<model>.json" file:
+      {"tags": ["oak", "modern"], "dimensions": [2.1, 0.9, 0.8], "polygons": 12000}
+  dimensions are X/Y/Z in metres, polygons is the face count
+- Searching is plain Python over precomputed lowercase strings, and the last
+  result is cached so redraws and page flips do not filter again
+"""
+
+import json
+import math
+import os
+
+from . import furniture_loader
+
+
+class FurnitureEntry:
+    """One model in the catalog."""
+
+    __slots__ = (
+        "room_type", "category", "blend_name", "label",
+        "tags", "dimensions", "polygons", "haystack",
+    )
+
+    def __init__(self, room_type, category, blend_name, tags=(), dimensions=None, polygons=0):
+        self.room_type = room_type
+        self.category = category
+        # Path relative to the category folder, may include subfolders
+        self.blend_name = blend_name
+        self.label = os.path.splitext(os.path.basename(blend_name))[0]
+        # Validate sidecar values here so bad metadata fails in rebuild(),
+        # not later inside a search or a UI update callback
+        if not isinstance(tags, (list, tuple)) or not all(isinstance(t, str) for t in tags):
+            raise TypeError(f"tags must be a list of strings, got {tags!r}")
+        if dimensions is not None:
+            if not isinstance(dimensions, (list, tuple)) or len(dimensions) != 3:
+                raise ValueError(f"dimensions must be [x, y, z], got {dimensions!r}")
+            dimensions = tuple(float(d) for d in dimensions)
+            if not all(math.isfinite(d) and d >= 0 for d in dimensions):
+                raise ValueError(f"dimensions must be non-negative numbers, got {dimensions!r}")
+        # JSON allows 1e400 and Infinity, which int() cannot convert
+        if (isinstance(polygons, bool) or not isinstance(polygons, (int, float))
+                or not math.isfinite(polygons) or polygons < 0 or polygons != int(polygons)):
+            raise ValueError(f"polygons must be a non-negative integer, got {polygons!r}")
+        polygons = int(polygons)
+        self.tags = frozenset(t.lower() for t in tags)
+        self.dimensions = dimensions
+        self.polygons = polygons
+        # Room type is left out; the Room Type filter already covers it
+        self.haystack = " ".join([self.label, category, *sorted(self.tags)]).lower()
+
+    def fits(self, max_dims):
+        """True if the model fits inside max_dims (x, y, z), allowing a 90° turn."""
+        if self.dimensions is None:
+            return False
+        x, y, z = self.dimensions
+        max_x, max_y, max_z = max_dims
+        if z > max_z:
+            return False
+        return (x <= max_x and y <= max_y) or (y <= max_x and x <= max_y)
+
+
+def _read_metadata(folder, filename, siblings):
+    """Return the sidecar metadata dict for filename, or {} if there is none."""
+    sidecar = os.path.splitext(filename)[0] + ".json"
+    if sidecar not in siblings:
+        return {}
+    try:
+        with open(os.path.join(folder, sidecar), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[MiO Index] Bad metadata {sidecar}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class FurnitureIndex:
+    """Catalog of all furniture models, rebuilt on demand."""
+
+    def __init__(self):
+        self.entries = []
+        self.room_types = []
+        self.categories = {}
+        self._built = False
+        self._last_key = None
+        self._last_result = []
+
+    def ensure_built(self):
+        if not self._built:
+            self.rebuild()
+
+    def rebuild(self):
+        """Rescan the asset tree and replace the index contents."""
+        paths = furniture_loader.discover_furniture_paths()
+        # Keep the loader in sync so load_furniture_model sees new categories
+        furniture_loader.FURNITURE_PATHS.clear()
+        furniture_loader.FURNITURE_PATHS.update(paths)
+
+        entries = []
+        for room_type, categories in paths.items():
+            for category, category_dir in categories.items():
+                for folder, _dirs, files in os.walk(category_dir):
+                    siblings = set(files)
+                    for file in files:
+                        if not file.lower().endswith(".blend"):
+                            continue
+                        meta = _read_metadata(folder, file, siblings)
+                        rel = os.path.relpath(os.path.join(folder, file), category_dir)
+                        try:
+                            entries.append(FurnitureEntry(
+                                room_type, category, rel,
+                                tags=meta.get("tags", ()),
+                                dimensions=meta.get("dimensions"),
+                                polygons=meta.get("polygons", 0),
+                            ))
+                        except (TypeError, ValueError) as e:
+                            print(f"[MiO Index] Skipping metadata for {rel}: {e}")
+                            entries.append(FurnitureEntry(room_type, category, rel))
+
+        entries.sort(key=lambda e: (e.room_type, e.category, e.label.lower()))
+        self.entries = entries
+        self.room_types = list(paths.keys())
+        self.categories = {room: list(cats.keys()) for room, cats in paths.items()}
+        self._built = True
+        self._last_key = None
+        self._last_result = []
+        print(f"[MiO Index] Indexed {len(entries)} models.")
+        return len(entries)
+
+    def search(self, text="", room_type=None, category=None, tags=(), max_dims=None, max_polygons=0):
+        """Return the entries matching every given filter.
+
+        text: whitespace separated terms, each must appear in name/category/tags
+        room_type, category: exact match, None for any
+        tags: every tag must be present on the entry
+        max_dims: (x, y, z) the model must fit inside, None for no limit
+        max_polygons: face budget, 0 for no limit
+        """
+        self.ensure_built()
+        terms = tuple(text.lower().split())
+        tags = frozenset(t.lower() for t in tags)
+        key = (terms, room_type, category, tags,
+               tuple(max_dims) if max_dims else None, max_polygons)
+        if key == self._last_key:
+            return self._last_result
+
+        result = []
+        for entry in self.entries:
+            if room_type and entry.room_type != room_type:
+                continue
+            if category and entry.category != category:
+                continue
+            if tags and not tags <= entry.tags:
+                continue
+            if max_polygons and not (0 < entry.polygons <= max_polygons):
+                continue
+            if max_dims and not entry.fits(max_dims):
+                continue
+            haystack = entry.haystack
+            if terms and not all(term in haystack for term in terms):
+                continue
+            result.append(entry)
+
+        self._last_key = key
+        self._last_result = result
+        return result
+
+
+# Shared index used by the furniture UI
+INDEX = FurnitureIndex()
@@ -1,7 +1,8 @@
 # ============================================================
 # furniture_loader_module.py
 # ------------------------------------------------------------
-# Handles listing and loading furniture models from assets.
+# Handles discovering asset folders and loading furniture models.
+# Model listing lives in furniture_index.
 # ============================================================
 
 import bpy
@@ -12,40 +13,36 @@ ASSET_ROOT = os.path.join(
     os.path.dirname(__file__), "assets"
 )
 
-# Subdirectories for each room type and category
-FURNITURE_PATHS = {
-    "bedroom": {
-        "Beds": os.path.join(ASSET_ROOT, "bedroom", "Beds"),
-        "Wardrobes": os.path.join(ASSET_ROOT, "bedroom", "Wardrobes"),
-    },
-    "kitchen": {
-        "Kitchen Tables": os.path.join(ASSET_ROOT, "kitchen", "Kitchen Tables"),
-        "Kitchen Chairs": os.path.join(ASSET_ROOT, "kitchen", "Kitchen Chairs"),
-    },
-    "livingroom": {
-        "Sofas": os.path.join(ASSET_ROOT, "livingroom", "Sofas"),
-        "Coffee Tables": os.path.join(ASSET_ROOT, "livingroom", "Coffee Tables"),
-    },
-}
-
-
-def list_furniture_models(room_type, category):
-    """Return a list of .blend files for the given room type and category."""
-    models = []
-    try:
-        folder = FURNITURE_PATHS[room_type][category]
-    except KeyError:
-        print(f"[MiO Loader] Invalid room_type/category: {room_type}/{category}")
-        return []
 
-    if not os.path.exists(folder):
-        print(f"[MiO Loader] Path does not exist: {folder}")
-        return []
+def discover_furniture_paths(root=ASSET_ROOT):
+    """Return {room_type: {category: folder}} found under the asset root.
+
+    Every directory directly under ``root`` is a room type and every directory
+    directly under a room type is a category, so new furniture only needs a
+    folder on disk to show up in the UI.
+    """
+    paths = {}
+    if not os.path.isdir(root):
+        print(f"[MiO Loader] Asset root does not exist: {root}")
+        return paths
 
-    for file in os.listdir(folder):
-        if file.lower().endswith(".blend"):
-            models.append(file)
-    return models
+    for room_type in sorted(os.listdir(root)):
+        room_dir = os.path.join(root, room_type)
+        if room_type.startswith(".") or not os.path.isdir(room_dir):
+            continue
+        categories = {}
+        for category in sorted(os.listdir(room_dir)):
+            category_dir = os.path.join(room_dir, category)
+            if category.startswith(".") or not os.path.isdir(category_dir):
+                continue
+            categories[category] = category_dir
+        if categories:
+            paths[room_type] = categories
+    return paths
+
+
+# Subdirectories for each room type and category (refreshed by the index)
+FURNITURE_PATHS = discover_furniture_paths()
 
 
 def load_furniture_model(room_type, category, blend_name):
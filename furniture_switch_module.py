@@ -1,59 +1,252 @@
 """
 furniture_switch_module.py
 
-- Property group describing room_type, category, model
-- Model list is populated dynamically by calling loader.list_furniture_models()
-- Switch operator clears MiO_Furniture and appends the chosen .blend
+- Property group describing room_type, category and search filters
+- Room types and categories come from furniture_index (discovered from the asset tree)
+- Filter changes query the index and copy only the current page into a
+  collection, so the UIList stays small no matter how large the catalog is
+- Switch operator clears MiO_Furniture and appends the highlighted .blend
 - UI in MiO tab
 """
 
 import bpy
-from bpy.types import Operator, Panel, PropertyGroup
-from bpy.props import EnumProperty
+from bpy.app.handlers import persistent
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import (
+    BoolProperty,
+    CollectionProperty,
+    EnumProperty,
+    IntProperty,
+    StringProperty,
+)
+
+from . import furniture_index
+from . import spawn_room_module
+
+ALL = "ALL"
+
+# Blender requires dynamic enum items to stay referenced from Python
+_room_type_items = []
+_category_items = []
+
+
+def _get_room_type_items(self, context):
+    furniture_index.INDEX.ensure_built()
+    _room_type_items[:] = [(ALL, "All Rooms", "")] + [
+        (room, room.replace("_", " ").title(), "")
+        for room in furniture_index.INDEX.room_types
+    ]
+    return _room_type_items
+
+
+def _get_category_items(self, context):
+    index = furniture_index.INDEX
+    index.ensure_built()
+    if self.room_type == ALL:
+        categories = sorted({c for cats in index.categories.values() for c in cats})
+    else:
+        categories = index.categories.get(self.room_type, [])
+    _category_items[:] = [(ALL, "All Categories", "")] + [(c, c, "") for c in categories]
+    return _category_items
+
+
+def _on_room_type_changed(self, context):
+    # The category list depends on the room type; this also refreshes results
+    self.category = ALL
+
+
+def _on_filter_changed(self, context):
+    # Item assignment skips _on_page_changed so results are filled only once
+    self["page"] = 0
+    refresh_results(self)
+
+
+def _on_page_changed(self, context):
+    refresh_results(self)
+
+
+def _search(props):
+    """Run the index query described by props."""
+    max_dims = None
+    if props.fit_room:
+        # props lives on the scene, so this also works without a UI context
+        room = props.id_data.mio_room_props
+        # Walls stand inside the room footprint, so only the interior is usable
+        walls = 2 * spawn_room_module.WALL_THICKNESS
+        max_dims = (room.room_length - walls, room.room_width - walls, room.room_height)
+    tags = [t.strip() for t in props.tags.split(",") if t.strip()]
+    return furniture_index.INDEX.search(
+        text=props.search,
+        room_type=None if props.room_type == ALL else props.room_type,
+        category=None if props.category == ALL else props.category,
+        tags=tags,
+        max_dims=max_dims,
+        max_polygons=props.max_polygons,
+    )
+
+
+def refresh_results(props):
+    """Copy the current page of search results into props.results."""
+    matches = _search(props)
+    page_count = max(1, -(-len(matches) // props.page_size))
+    page = min(props.page, page_count - 1)
+    if page != props.page:
+        # Triggers _on_page_changed, which calls back in with a valid page
+        props.page = page
+        return
+
+    start = page * props.page_size
+    props.results.clear()
+    for entry in matches[start:start + props.page_size]:
+        item = props.results.add()
+        item.name = entry.label
+        item.room_type = entry.room_type
+        item.category = entry.category
+        item.blend_name = entry.blend_name
+        item.info = _describe(entry)
+    props.results_index = min(props.results_index, max(0, len(props.results) - 1))
+    props.match_count = len(matches)
+
+
+def refresh_all_scenes():
+    """Fill the first page of results in every scene."""
+    for scene in bpy.data.scenes:
+        props = getattr(scene, "mio_furniture_props", None)
+        if props is not None:
+            refresh_results(props)
+
+
+@persistent
+def _on_load_post(*args):
+    refresh_all_scenes()
+
+
+def _refresh_on_startup():
+    # Properties cannot be written during register(), so defer to a timer
+    refresh_all_scenes()
+    return None
+
+
+def register_handlers():
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
+    bpy.app.timers.register(_refresh_on_startup, first_interval=0.1)
+
+
+def unregister_handlers():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    if bpy.app.timers.is_registered(_refresh_on_startup):
+        bpy.app.timers.unregister(_refresh_on_startup)
+
+
+def _describe(entry):
+    parts = []
+    if entry.dimensions:
+        parts.append("{:.2f} x {:.2f} x {:.2f} m".format(*entry.dimensions))
+    if entry.polygons:
+        parts.append(f"{entry.polygons:,} faces")
+    return ", ".join(parts)
+
+
+class MIOFurnitureResult(PropertyGroup):
+    # name holds the display label
+    room_type: StringProperty()
+    category: StringProperty()
+    blend_name: StringProperty()
+    info: StringProperty()
 
 
 class MIOFurnitureProperties(PropertyGroup):
     room_type: EnumProperty(
         name="Room Type",
-        items=[
-            ("livingroom", "Living Room", ""),
-            ("bedroom", "Bedroom", ""),
-            ("kitchen", "Kitchen", ""),
-        ],
-        default="livingroom",
+        items=_get_room_type_items,
+        update=_on_room_type_changed,
     )
 
     category: EnumProperty(
         name="Category",
-        items=[
-            ("Sofas", "Sofas", ""),
-            ("Coffee Tables", "Coffee Tables", ""),
-            ("Beds", "Beds", ""),
-            ("Wardrobes", "Wardrobes", ""),
-            ("Kitchen Tables", "Kitchen Tables", ""),
-            ("Kitchen Chairs", "Kitchen Chairs", ""),
-        ],
-        default="Sofas",
+        items=_get_category_items,
+        update=_on_filter_changed,
     )
 
-    model: EnumProperty(
-        name="Model",
-        description="Choose a .blend model to append",
-        items=lambda self, context: MIOFurnitureProperties._get_model_items(self, context)
+    search: StringProperty(
+        name="Search",
+        description="Words that must appear in the model name, category or tags",
+        update=_on_filter_changed,
+        options={"TEXTEDIT_UPDATE"},
     )
 
-    @staticmethod
-    def _get_model_items(self, context):
-        # Import loader locally to avoid circular import during module load
-        try:
-            from . import furniture_loader_module
-        except Exception as e:
-            print(f"[MiO] loader import error: {e}")
-            return [("NONE", "Loader error", "")]
-        files = furniture_loader_module.list_furniture_models(self.room_type, self.category)
-        if not files:
-            return [("NONE", "No models found", "")]
-        return [(f, f.replace(".blend", ""), "") for f in files]
+    tags: StringProperty(
+        name="Tags",
+        description="Comma separated tags the model must have",
+        update=_on_filter_changed,
+    )
+
+    fit_room: BoolProperty(
+        name="Fits in Room",
+        description="Only show models whose dimensions fit inside the current room settings",
+        default=False,
+        update=_on_filter_changed,
+    )
+
+    max_polygons: IntProperty(
+        name="Max Faces",
+        description="Only show models with at most this many faces (0 = no limit)",
+        default=0,
+        min=0,
+        update=_on_filter_changed,
+    )
+
+    page: IntProperty(name="Page", default=0, min=0, update=_on_page_changed)
+    page_size: IntProperty(name="Page Size", default=20, min=5, max=200, update=_on_filter_changed)
+    match_count: IntProperty(name="Matches", default=0)
+
+    results: CollectionProperty(type=MIOFurnitureResult)
+    results_index: IntProperty(name="Selected Model", default=0)
+
+
+class MIO_UL_furniture_results(UIList):
+    bl_idname = "MIO_UL_furniture_results"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name, icon="OBJECT_DATA")
+        if item.info:
+            row.label(text=item.info)
+        else:
+            row.label(text=item.category)
+
+
+class MIO_OT_refresh_furniture_index(Operator):
+    bl_idname = "mio.refresh_furniture_index"
+    bl_label = "Refresh Catalog"
+    bl_description = "Rescan the asset folders and rebuild the furniture index"
+
+    def execute(self, context):
+        count = furniture_index.INDEX.rebuild()
+        props = context.scene.mio_furniture_props
+        # Dynamic enums are stored by index, which new folders can shift
+        props.room_type = ALL
+        props.category = ALL
+        refresh_results(props)
+        self.report({"INFO"}, f"Indexed {count} models.")
+        return {"FINISHED"}
+
+
+class MIO_OT_furniture_page(Operator):
+    bl_idname = "mio.furniture_page"
+    bl_label = "Change Page"
+    bl_description = "Show the previous or next page of models"
+    bl_options = {"INTERNAL"}
+
+    step: IntProperty(default=1)
+
+    def execute(self, context):
+        props = context.scene.mio_furniture_props
+        page_count = max(1, -(-props.match_count // props.page_size))
+        props.page = max(0, min(props.page + self.step, page_count - 1))
+        return {"FINISHED"}
 
 
 class MIO_OT_switch_furniture(Operator):
@@ -64,27 +257,28 @@ class MIO_OT_switch_furniture(Operator):
     def execute(self, context):
         props = context.scene.mio_furniture_props
 
-        if props.model == "NONE":
+        if not 0 <= props.results_index < len(props.results):
             self.report({"WARNING"}, "No model selected")
             return {"CANCELLED"}
+        item = props.results[props.results_index]
 
         # local import
         try:
-            from . import furniture_loader_module
+            from . import furniture_loader
         except Exception as e:
             self.report({"ERROR"}, f"Loader import failed: {e}")
             return {"CANCELLED"}
 
         # clear prior furniture
-        furniture_loader_module.clear_spawned_furniture()
+        furniture_loader.clear_spawned_furniture()
 
         # append selected model
-        appended = furniture_loader_module.load_furniture_model(props.room_type, props.category, props.model)
+        appended = furniture_loader.load_furniture_model(item.room_type, item.category, item.blend_name)
         if not appended:
-            self.report({"ERROR"}, f"Failed to load {props.model}")
+            self.report({"ERROR"}, f"Failed to load {item.name}")
             return {"CANCELLED"}
 
-        self.report({"INFO"}, f"Loaded {props.model} ({len(appended)} objects).")
+        self.report({"INFO"}, f"Loaded {item.name} ({len(appended)} objects).")
         return {"FINISHED"}
 
 
@@ -102,13 +296,37 @@ class MIO_PT_furniture_switcher(Panel):
         layout.label(text="Furniture")
         layout.prop(props, "room_type")
         layout.prop(props, "category")
-        layout.prop(props, "model")
+        layout.prop(props, "search", icon="VIEWZOOM")
+        layout.prop(props, "tags")
+        row = layout.row()
+        row.prop(props, "fit_room")
+        row.prop(props, "max_polygons")
+
+        layout.template_list(
+            "MIO_UL_furniture_results", "",
+            props, "results", props, "results_index",
+            rows=8,
+        )
+
+        page_count = max(1, -(-props.match_count // props.page_size))
+        row = layout.row(align=True)
+        prev_op = row.operator("mio.furniture_page", text="", icon="TRIA_LEFT")
+        prev_op.step = -1
+        row.label(text=f"Page {props.page + 1}/{page_count} ({props.match_count} models)")
+        next_op = row.operator("mio.furniture_page", text="", icon="TRIA_RIGHT")
+        next_op.step = 1
+
+        layout.operator("mio.refresh_furniture_index", icon="FILE_FOLDER")
         layout.operator("mio.switch_furniture", icon="FILE_REFRESH")
 
 
 # helper classes tuple (if you want to register this module alone)
 classes = (
+    MIOFurnitureResult,
     MIOFurnitureProperties,
+    MIO_UL_furniture_results,
+    MIO_OT_refresh_furniture_index,
+    MIO_OT_furniture_page,
     MIO_OT_switch_furniture,
     MIO_PT_furniture_switcher,
 )
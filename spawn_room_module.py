@@ -1,6 +1,112 @@
 import bpy
-from bpy.types import Operator, Panel, PropertyGroup
-from bpy.props import FloatProperty, FloatVectorProperty
+import bmesh
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import (
+    CollectionProperty,
+    EnumProperty,
+    FloatProperty,
+    FloatVectorProperty,
+    IntProperty,
+)
+
+WALL_THICKNESS = 0.1
+
+# Smallest opening (m) worth cutting; anything thinner is skipped
+MIN_OPENING = 0.001
+
+
+def _on_room_size_changed(self, context):
+    """Keep the furniture picker's "Fits in Room" results in step with the room size."""
+    # Import locally to avoid circular import (furniture_switch_module imports this module)
+    from . import furniture_switch_module
+    furniture_props = getattr(self.id_data, "mio_furniture_props", None)
+    if furniture_props is not None and furniture_props.fit_room:
+        furniture_switch_module.refresh_results(furniture_props)
+
+
+def _find_room():
+    room = bpy.data.objects.get("Room")
+    return room if room and room.type == "MESH" else None
+
+
+def rebuild_room(room, props):
+    """Rebuild room's mesh in place, leaving Edit Mode for the rebuild if needed."""
+    editing = room.data.is_editmode
+    if editing:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    try:
+        build_room_mesh(room.data, props)
+    finally:
+        if editing:
+            bpy.ops.object.mode_set(mode="EDIT")
+
+
+def _rebuild_existing_room(self, context):
+    room = _find_room()
+    if not room:
+        return
+    # Update callbacks must not switch modes, so leave edited rooms alone
+    if room.data.is_editmode:
+        print("[MiO] Room is in Edit Mode; use Scale Room to apply opening changes.")
+        return
+    # self is an opening stored on its scene, not necessarily context.scene
+    build_room_mesh(room.data, self.id_data.mio_room_props)
+
+
+# ============================================================
+# Door / Window Properties
+# ============================================================
+class MIORoomOpening(PropertyGroup):
+    kind: EnumProperty(
+        name="Type",
+        items=[
+            ("DOOR", "Door", ""),
+            ("WINDOW", "Window", ""),
+        ],
+        default="DOOR",
+    )
+    wall: EnumProperty(
+        name="Wall",
+        items=[
+            ("BACK", "Back", "Wall at -Y"),
+            ("FRONT", "Front", "Wall at +Y"),
+            ("LEFT", "Left", "Wall at -X"),
+            ("RIGHT", "Right", "Wall at +X"),
+        ],
+        default="BACK",
+        update=_rebuild_existing_room,
+    )
+    offset: FloatProperty(
+        name="Offset",
+        description="Distance from the wall's -X/-Y corner to the opening's edge",
+        default=0.5,
+        min=0.0,
+        unit="LENGTH",
+        update=_rebuild_existing_room,
+    )
+    width: FloatProperty(
+        name="Width",
+        default=0.9,
+        min=0.1,
+        unit="LENGTH",
+        update=_rebuild_existing_room,
+    )
+    height: FloatProperty(
+        name="Height",
+        default=2.0,
+        min=0.1,
+        unit="LENGTH",
+        update=_rebuild_existing_room,
+    )
+    sill: FloatProperty(
+        name="Sill Height",
+        description="Height of the opening's bottom edge above the floor",
+        default=0.0,
+        min=0.0,
+        unit="LENGTH",
+        update=_rebuild_existing_room,
+    )
+
 
 # ============================================================
 # Room Properties
@@ -12,6 +118,7 @@ class MIORoomProperties(PropertyGroup):
         default=4.0,
         min=1.0,
         max=20.0,
+        update=_on_room_size_changed,
     )
     room_width: FloatProperty(
         name="Room Width",
@@ -19,6 +126,7 @@ class MIORoomProperties(PropertyGroup):
         default=3.0,
         min=1.0,
         max=20.0,
+        update=_on_room_size_changed,
     )
     room_height: FloatProperty(
         name="Room Height",
@@ -26,6 +134,7 @@ class MIORoomProperties(PropertyGroup):
         default=2.5,
         min=1.0,
         max=5.0,
+        update=_on_room_size_changed,
     )
 
     wall_color: FloatVectorProperty(
@@ -48,6 +157,140 @@ class MIORoomProperties(PropertyGroup):
         description="Color of the floor",
     )
 
+    openings: CollectionProperty(type=MIORoomOpening)
+    openings_index: IntProperty(name="Selected Opening", default=0)
+
+
+# ============================================================
+# Room Mesh Builder
+# ============================================================
+def _wall_holes(props, wall, u_min, u_max, start):
+    """Return (u0, u1, z0, z1) rectangles for the openings on one wall.
+
+    Offsets are measured from ``start`` (the wall's -X/-Y corner) and the
+    rectangles are clipped to u_min..u_max, so openings keep their size when
+    the room is resized and never reach past a corner.
+    """
+    holes = []
+    for opening in props.openings:
+        if opening.wall != wall:
+            continue
+        u0 = max(u_min, start + opening.offset)
+        u1 = min(u_max, start + opening.offset + opening.width)
+        z0 = max(0.0, opening.sill)
+        z1 = min(props.room_height, opening.sill + opening.height)
+        if u1 - u0 > MIN_OPENING and z1 - z0 > MIN_OPENING:
+            holes.append((u0, u1, z0, z1))
+    return holes
+
+
+def _add_wall(bm, along_x, u_min, u_max, v_min, v_max, height, holes):
+    """Add a closed wall slab with rectangular holes and return its faces.
+
+    The wall face is split on a grid through every hole edge; grid cells
+    inside a hole are left out and every cell side that borders a hole or the
+    wall outline gets a face joining the two sides of the slab.
+    """
+    us = sorted({u_min, u_max, *(h[0] for h in holes), *(h[1] for h in holes)})
+    zs = sorted({0.0, height, *(h[2] for h in holes), *(h[3] for h in holes)})
+
+    def solid(i, j):
+        if not (0 <= i < len(us) - 1 and 0 <= j < len(zs) - 1):
+            return False
+        cu = (us[i] + us[i + 1]) / 2
+        cz = (zs[j] + zs[j + 1]) / 2
+        return not any(u0 < cu < u1 and z0 < cz < z1 for u0, u1, z0, z1 in holes)
+
+    verts = {}
+
+    def vert(i, j, side):
+        key = (i, j, side)
+        if key not in verts:
+            v = v_max if side else v_min
+            co = (us[i], v, zs[j]) if along_x else (v, us[i], zs[j])
+            verts[key] = bm.verts.new(co)
+        return verts[key]
+
+    faces = []
+    for i in range(len(us) - 1):
+        for j in range(len(zs) - 1):
+            if not solid(i, j):
+                continue
+            for side in (0, 1):
+                faces.append(bm.faces.new((
+                    vert(i, j, side), vert(i + 1, j, side),
+                    vert(i + 1, j + 1, side), vert(i, j + 1, side),
+                )))
+            edges = (
+                ((-1, 0), (i, j), (i, j + 1)),
+                ((1, 0), (i + 1, j), (i + 1, j + 1)),
+                ((0, -1), (i, j), (i + 1, j)),
+                ((0, 1), (i, j + 1), (i + 1, j + 1)),
+            )
+            for (di, dj), a, b in edges:
+                if not solid(i + di, j + dj):
+                    faces.append(bm.faces.new((
+                        vert(*a, 0), vert(*b, 0), vert(*b, 1), vert(*a, 1),
+                    )))
+    return faces
+
+
+def _add_floor_quad(bm, x0, x1, y0, y1):
+    """Add an upward-facing floor quad with the floor material."""
+    face = bm.faces.new((
+        bm.verts.new((x0, y0, 0.0)),
+        bm.verts.new((x1, y0, 0.0)),
+        bm.verts.new((x1, y1, 0.0)),
+        bm.verts.new((x0, y1, 0.0)),
+    ))
+    face.material_index = 0
+    return face
+
+
+def build_room_mesh(mesh, props):
+    """Replace mesh with a floor and four walls, doors and windows cut in.
+
+    Material slot 0 is the floor and slot 1 the walls.
+    """
+    length, width, height = props.room_length, props.room_width, props.room_height
+    half_len = length / 2
+    half_wid = width / 2
+    t = WALL_THICKNESS
+
+    bm = bmesh.new()
+    try:
+        # Floor covers the interior only; the walls' own bottom faces close the rest
+        _add_floor_quad(bm, -half_len + t, half_len - t, -half_wid + t, half_wid - t)
+
+        # Back/front run the full length, left/right fit between them
+        walls = (
+            ("BACK", True, -half_len, half_len, -half_wid, -half_wid + t, -half_len),
+            ("FRONT", True, -half_len, half_len, half_wid - t, half_wid, -half_len),
+            ("LEFT", False, -half_wid + t, half_wid - t, -half_len, -half_len + t, -half_wid),
+            ("RIGHT", False, -half_wid + t, half_wid - t, half_len - t, half_len, -half_wid),
+        )
+        for name, along_x, u_min, u_max, v_min, v_max, start in walls:
+            # Clip to the interior so no opening cuts into a corner block;
+            # the room is centred, so the far corner sits at -start
+            holes = _wall_holes(props, name, start + t, -start - t, start)
+            faces = _add_wall(bm, along_x, u_min, u_max, v_min, v_max, height, holes)
+            bmesh.ops.recalc_face_normals(bm, faces=faces)
+            for face in faces:
+                face.material_index = 1
+
+            # Doors remove the wall's bottom face, so fill the threshold with floor
+            for u0, u1, z0, _z1 in holes:
+                if z0 == 0.0:
+                    if along_x:
+                        _add_floor_quad(bm, u0, u1, v_min, v_max)
+                    else:
+                        _add_floor_quad(bm, v_min, v_max, u0, u1)
+
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
+
 
 # ============================================================
 # Spawn Room Operator
@@ -68,65 +311,21 @@ class MIO_OT_spawn_room(Operator):
             if obj.name.startswith("MiO_"):
                 bpy.data.objects.remove(obj, do_unlink=True)
 
-        length, width, height = props.room_length, props.room_width, props.room_height
-        wall_thickness = 0.1
-
-        # Create floor
-        bpy.ops.mesh.primitive_plane_add(size=1)
-        floor = bpy.context.active_object
-        floor.name = "MiO_Floor"
-        floor.scale = (length / 2, width / 2, 1)
-        floor.location = (0, 0, 0)
-
-        # Helper to create a wall
-        def create_wall(name, size_x, size_y, loc):
-            bpy.ops.mesh.primitive_cube_add(size=1, location=loc)
-            wall = bpy.context.active_object
-            wall.name = name
-            wall.scale = (size_x / 2, size_y / 2, height / 2)
-            return wall
-
-        half_len = length / 2
-        half_wid = width / 2
-
-        # Base z-offset so walls sit flush on floor
-        z_offset = height / 2 - 0.6
-
-        # Create walls with requested offsets
-        back_wall = create_wall(
-            "MiO_Wall_Back", length, wall_thickness,
-            (0, -half_wid + wall_thickness / 2 - 0.7, z_offset)
-        )
-        front_wall = create_wall(
-            "MiO_Wall_Front", length, wall_thickness,
-            (0 + 0.95, half_wid - wall_thickness / 2 - 0.7, z_offset)
-        )
-        left_wall = create_wall(
-            "MiO_Wall_Left", wall_thickness, width,
-            (-half_len + wall_thickness / 2 + 0.95, 0, z_offset)
-        )
-        right_wall = create_wall(
-            "MiO_Wall_Right", wall_thickness, width,
-            (half_len - wall_thickness / 2, 0, z_offset)
-        )
+        mesh = bpy.data.meshes.new("Room")
+        build_room_mesh(mesh, props)
 
         # Assign materials
-        wall_mat = self._get_or_create_material("MiO_Wall_Mat", props.wall_color)
         floor_mat = self._get_or_create_material("MiO_Floor_Mat", props.floor_color)
-        for wall in [back_wall, front_wall, left_wall, right_wall]:
-            self._assign_material(wall, wall_mat)
-        self._assign_material(floor, floor_mat)
-
-        # Join into one object
-        objs = [floor, back_wall, front_wall, left_wall, right_wall]
-        bpy.context.view_layer.objects.active = floor
-        for o in objs:
-            o.select_set(True)
-        bpy.ops.object.join()
+        wall_mat = self._get_or_create_material("MiO_Wall_Mat", props.wall_color)
+        mesh.materials.append(floor_mat)
+        mesh.materials.append(wall_mat)
 
-        joined = bpy.context.active_object
-        joined.name = "Room"
-        joined.location = (0, 0, 0)
+        room = bpy.data.objects.new("Room", mesh)
+        context.collection.objects.link(room)
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        room.select_set(True)
+        context.view_layer.objects.active = room
 
         self.report({'INFO'}, "Room created successfully.")
         return {'FINISHED'}
@@ -141,12 +340,6 @@ class MIO_OT_spawn_room(Operator):
             bsdf.inputs["Base Color"].default_value = color
         return mat
 
-    def _assign_material(self, obj, mat):
-        if obj.data.materials:
-            obj.data.materials[0] = mat
-        else:
-            obj.data.materials.append(mat)
-
 
 # ============================================================
 # Scale Room Operator
@@ -154,21 +347,19 @@ class MIO_OT_spawn_room(Operator):
 class MIO_OT_scale_room(Operator):
     bl_idname = "mio.scale_room"
     bl_label = "Scale Room"
-    bl_description = "Scale the existing room to match updated dimensions"
+    bl_description = "Rebuild the existing room to match updated dimensions"
 
     def execute(self, context):
         props = context.scene.mio_room_props
-        room = bpy.data.objects.get("Room")
+        room = _find_room()
 
         if not room:
             self.report({"WARNING"}, "No room found. Please spawn one first.")
             return {"CANCELLED"}
 
-        room.scale = (
-            props.room_length / 4.0,
-            props.room_width / 3.0,
-            props.room_height / 2.5,
-        )
+        # Rebuild instead of scaling so doors and windows keep their size
+        rebuild_room(room, props)
+        room.scale = (1.0, 1.0, 1.0)
 
         self.report({"INFO"}, "Room scaled successfully.")
         return {"FINISHED"}
@@ -235,11 +426,81 @@ class MIO_OT_reset_room(Operator):
         props.room_height = 2.5
         props.wall_color = (0.8, 0.8, 0.8, 1.0)
         props.floor_color = (0.5, 0.4, 0.3, 1.0)
+        props.openings.clear()
+        props.openings_index = 0
 
         self.report({'INFO'}, "Room and settings reset.")
         return {'FINISHED'}
 
 
+# ============================================================
+# Door / Window Operators
+# ============================================================
+class MIO_OT_add_opening(Operator):
+    bl_idname = "mio.add_opening"
+    bl_label = "Add Opening"
+    bl_description = "Add a door or window to the room walls"
+
+    kind: EnumProperty(
+        items=[
+            ("DOOR", "Door", ""),
+            ("WINDOW", "Window", ""),
+        ],
+        default="DOOR",
+    )
+
+    def execute(self, context):
+        props = context.scene.mio_room_props
+
+        opening = props.openings.add()
+        opening.kind = self.kind
+        if self.kind == "WINDOW":
+            # Item assignment skips the update callbacks; rebuild once below
+            opening["width"] = 1.2
+            opening["height"] = 1.0
+            opening["sill"] = 0.9
+        props.openings_index = len(props.openings) - 1
+
+        room = _find_room()
+        if room:
+            rebuild_room(room, props)
+        return {'FINISHED'}
+
+
+class MIO_OT_remove_opening(Operator):
+    bl_idname = "mio.remove_opening"
+    bl_label = "Remove Opening"
+    bl_description = "Remove the selected door or window"
+
+    @classmethod
+    def poll(cls, context):
+        props = context.scene.mio_room_props
+        return 0 <= props.openings_index < len(props.openings)
+
+    def execute(self, context):
+        props = context.scene.mio_room_props
+
+        props.openings.remove(props.openings_index)
+        props.openings_index = max(0, props.openings_index - 1)
+
+        room = _find_room()
+        if room:
+            rebuild_room(room, props)
+        return {'FINISHED'}
+
+
+class MIO_UL_room_openings(UIList):
+    bl_idname = "MIO_UL_room_openings"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(
+            text=f"{item.kind.title()} on {item.wall.title()} wall",
+            icon="MESH_PLANE" if item.kind == "WINDOW" else "MOD_BUILD",
+        )
+        row.label(text=f"{item.width:.2f} x {item.height:.2f} m")
+
+
 # ============================================================
 # Panel UI
 # ============================================================
@@ -262,6 +523,29 @@ class MIO_PT_room_spawner(Panel):
         layout.operator("mio.spawn_room", icon="CUBE")
         layout.operator("mio.scale_room", icon="FULLSCREEN_ENTER")
 
+        layout.separator()
+        layout.label(text="Doors & Windows:")
+        row = layout.row()
+        row.template_list(
+            "MIO_UL_room_openings", "",
+            props, "openings", props, "openings_index",
+            rows=3,
+        )
+        col = row.column(align=True)
+        col.operator("mio.add_opening", text="", icon="ADD").kind = "DOOR"
+        col.operator("mio.add_opening", text="", icon="MESH_PLANE").kind = "WINDOW"
+        col.operator("mio.remove_opening", text="", icon="REMOVE")
+
+        if 0 <= props.openings_index < len(props.openings):
+            opening = props.openings[props.openings_index]
+            col = layout.column(align=True)
+            col.prop(opening, "kind")
+            col.prop(opening, "wall")
+            col.prop(opening, "offset")
+            col.prop(opening, "width")
+            col.prop(opening, "height")
+            col.prop(opening, "sill")
+
         layout.separator()
         layout.label(text="Room Colors:")
         layout.prop(props, "wall_color")
@@ -276,10 +560,14 @@ class MIO_PT_room_spawner(Panel):
 # Registration
 # ============================================================
 classes = (
+    MIORoomOpening,
     MIORoomProperties,
     MIO_OT_spawn_room,
     MIO_OT_scale_room,
     MIO_OT_update_room_colors,
     MIO_OT_reset_room,
+    MIO_OT_add_opening,
+    MIO_OT_remove_opening,
+    MIO_UL_room_openings,
     MIO_PT_room_spawner,
 )